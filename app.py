@@ -7,18 +7,60 @@ from Nasdaq and serves a beautiful mobile-friendly dashboard.
 Deploy free on Render.com, Railway.app, or Fly.io.
 """
 
+import gzip
+import hashlib
 import json
-import urllib.request
 import re
 import os
 import time
 import threading
-from datetime import datetime, date
-from flask import Flask, Response, send_from_directory
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+import requests
+from requests.adapters import HTTPAdapter
+from flask import Flask, Response, request
+
+# orjson is a drop-in speedup; fall back to stdlib json where it won't install
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        return json.dumps(obj, default=str).encode("utf-8")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 app = Flask(__name__)
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
 
+
+def load_asset(filename, mimetype):
+    # Small enough to keep in memory, so requests never touch the filesystem
+    with open(os.path.join(APP_DIR, filename), "rb") as f:
+        data = f.read()
+    return {"data": data, "mimetype": mimetype,
+            "etag": hashlib.blake2b(data, digest_size=6).hexdigest()}
+
+
+ASSETS = {
+    "profile.jpg": load_asset("profile.jpg", "image/jpeg"),
+    "celebration.mp4": load_asset("celebration.mp4", "video/mp4"),
+}
+# Content hash in the query string busts the far-future cache when a file changes
+PROFILE_URL = f"/profile.jpg?v={ASSETS['profile.jpg']['etag']}"
+VIDEO_URL = f"/celebration.mp4?v={ASSETS['celebration.mp4']['etag']}"
+ASSET_MAX_AGE = 31536000  # one year; asset URLs are versioned
+
 # ── YOUR POSITIONS (edit if you open/close positions) ──────────────────
 POSITIONS = [
     {"label": "Nov 20 '26 $13 Call", "strike": "13.00", "strike_num": 13, "expiry": "2026-11-20",
@@ -31,40 +73,92 @@ POSITIONS = [
 TOTAL_COST_BASIS = 252425
 # ───────────────────────────────────────────────────────────────────────
 
+# Cost basis only depends on the static position data, so work it out once
+for _pos in POSITIONS:
+    _pos["cost_basis"] = _pos["contracts"] * _pos["cost_per"] * 100
+
+# Parse expiries once; DTE is then just date subtraction on each refresh
+_EXPIRY_DATES = {p["expiry"]: date.fromisoformat(p["expiry"]) for p in POSITIONS}
+# Nasdaq labels chain rows like "Jun 18"; used to pick positions out of the bulk chain
+_EXPIRY_LABELS = {k: f"{d:%b} {d.day}" for k, d in _EXPIRY_DATES.items()}
+_CHAIN_FROM = min(p["fromdate"] for p in POSITIONS)
+_CHAIN_TO = max(p["todate"] for p in POSITIONS)
+# Those labels carry no year, so only coalesce when the range can't repeat one
+_BULK_CHAIN = (
+    date.fromisoformat(_CHAIN_TO) - date.fromisoformat(_CHAIN_FROM) < timedelta(days=365)
+)
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
     "Accept": "application/json",
 }
 
+_PRICE_RE = re.compile(rb'data-last-price="([^"]+)"')
+
+# Keep-alive session so refreshes reuse TLS connections to Nasdaq/Google
+_session = requests.Session()
+_session.headers.update(HEADERS)
+for _host in ("https://api.nasdaq.com", "https://www.google.com"):
+    _session.mount(_host, HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 # Cache to avoid hammering Nasdaq on every request
-_cache = {"data": None, "time": 0}
+_cache = {"data": None, "time": 0, "html": None, "html_gz": None, "html_br": None, "etag": None}
+_cache_lock = threading.Lock()
+_refresh_lock = threading.Lock()  # one refresh in flight at a time
 CACHE_TTL = 120  # seconds
+REFRESH_TIMEOUT = 10  # seconds; a slower refresh is abandoned and the last good data kept
+
+# Shared pool so the stock quote and option chains are fetched concurrently
+_executor = ThreadPoolExecutor(max_workers=len(POSITIONS) + 1)
 
 
 def fetch_json(url):
-    req = urllib.request.Request(url, headers=HEADERS)
-    with urllib.request.urlopen(req, timeout=15) as resp:
-        return json.loads(resp.read().decode())
+    resp = _session.get(url, timeout=15)
+    resp.raise_for_status()
+    return json_loads(resp.content)
 
 
 def fetch_stock_price():
     url = "https://www.google.com/finance/quote/CIFR:NASDAQ"
-    req = urllib.request.Request(url, headers=HEADERS)
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        html = resp.read().decode()
-    m = re.search(r'data-last-price="([^"]+)"', html)
+    resp = _session.get(url, timeout=10)
+    resp.raise_for_status()
+    # Match on the raw bytes to skip decoding the whole quote page
+    m = _PRICE_RE.search(resp.content)
     return float(m.group(1)) if m else None
 
 
-def fetch_option(fromdate, todate, strike):
+def fetch_chain_rows(fromdate, todate, limit=100):
     url = (
         f"https://api.nasdaq.com/api/quote/CIFR/option-chain"
-        f"?assetclass=stocks&limit=100&fromdate={fromdate}&todate={todate}"
+        f"?assetclass=stocks&limit={limit}&fromdate={fromdate}&todate={todate}"
         f"&money=all&callput=call"
     )
     data = fetch_json(url)
-    rows = data.get("data", {}).get("table", {}).get("rows", [])
-    return next((r for r in rows if r.get("strike") == strike), None)
+    return data.get("data", {}).get("table", {}).get("rows", [])
+
+
+def fetch_chain(fromdate, todate):
+    return {r.get("strike"): r for r in fetch_chain_rows(fromdate, todate)}
+
+
+def fetch_all_chains():
+    # One request spanning every position's expiry, keyed by (expiry label, strike)
+    rows = fetch_chain_rows(_CHAIN_FROM, _CHAIN_TO, limit=1000)
+    return {(r.get("expiryDate"), r.get("strike")): r for r in rows}
+
+
+def fetch_quietly(fn, *args):
+    # Swallow errors so one bad chain doesn't take down the other positions
+    try:
+        return fn(*args)
+    except Exception:
+        return {}
+
+
+def wait_all(futures, deadline):
+    _, pending = wait(futures, timeout=max(0, deadline - time.time()))
+    if pending:
+        raise TimeoutError(f"Quote refresh took longer than {REFRESH_TIMEOUT}s")
 
 
 def parse_val(v):
@@ -76,45 +170,79 @@ def parse_val(v):
         return None
 
 
-def days_until(date_str):
-    target = datetime.strptime(date_str, "%Y-%m-%d").date()
-    return (target - date.today()).days
-
-
-def gather_data():
+def refresh_data():
     now = time.time()
-    if _cache["data"] and (now - _cache["time"]) < CACHE_TTL:
-        return _cache["data"]
-
-    stock_price = fetch_stock_price()
+    deadline = now + REFRESH_TIMEOUT
+    stock_future = _executor.submit(fetch_stock_price)
+    bulk = {}
+    if _BULK_CHAIN:
+        bulk_future = _executor.submit(fetch_quietly, fetch_all_chains)
+        wait_all([bulk_future], deadline)
+        bulk = bulk_future.result()
+    # Expired positions drop off the chain, so don't look for (or chase) them
+    today = date.today()
+    live = [_EXPIRY_DATES[p["expiry"]] >= today for p in POSITIONS]
+    matches = [
+        bulk.get((_EXPIRY_LABELS[p["expiry"]], p["strike"])) if is_live else None
+        for p, is_live in zip(POSITIONS, live)
+    ]
+
+    # Fall back to per-expiry requests for anything the bulk chain missed;
+    # positions sharing an expiry window share one request
+    fallback = [p for p, m, is_live in zip(POSITIONS, matches, live) if is_live and m is None]
+    if fallback and _BULK_CHAIN:
+        app.logger.warning(
+            "Bulk option chain missed %s; fetching per expiry",
+            ", ".join(p["label"] for p in fallback),
+        )
+    missing = dict.fromkeys((p["fromdate"], p["todate"]) for p in fallback)
+    if missing:
+        chain_futures = {
+            dates: _executor.submit(fetch_quietly, fetch_chain, *dates) for dates in missing
+        }
+        wait_all(chain_futures.values(), deadline)
+        chains = {dates: f.result() for dates, f in chain_futures.items()}
+        matches = [
+            chains[(p["fromdate"], p["todate"])].get(p["strike"]) if is_live and m is None else m
+            for p, m, is_live in zip(POSITIONS, matches, live)
+        ]
+    wait_all([stock_future], deadline)
+    stock_price = stock_future.result()
+    prev = _cache["data"]
+    prev_results = {(r["expiry"], r["strike"]): r for r in prev["positions"]} if prev else {}
     results = []
 
-    for pos in POSITIONS:
-        try:
-            match = fetch_option(pos["fromdate"], pos["todate"], pos["strike"])
-            bid = parse_val(match.get("c_Bid")) if match else None
-            ask = parse_val(match.get("c_Ask")) if match else None
-            last = parse_val(match.get("c_Last")) if match else None
-            vol = match.get("c_Volume", "--") if match else "--"
-            oi = match.get("c_Openinterest", "--") if match else "--"
-        except Exception:
+    for pos, match, is_live in zip(POSITIONS, matches, live):
+        last_good = prev_results.get((pos["expiry"], pos["strike"]))
+        stale = False
+        if match:
+            bid = parse_val(match.get("c_Bid"))
+            ask = parse_val(match.get("c_Ask"))
+            last = parse_val(match.get("c_Last"))
+            vol = match.get("c_Volume", "--")
+            oi = match.get("c_Openinterest", "--")
+        elif last_good and last_good["mid"] and is_live:
+            # Carry the last good quote forward rather than dropping the position
+            bid, ask, last, vol, oi = (last_good[k] for k in ("bid", "ask", "last", "vol", "oi"))
+            stale = True
+        else:
             bid = ask = last = None
             vol = oi = "--"
 
         mid = (bid + ask) / 2 if bid and ask else last
-        cost_basis = pos["contracts"] * pos["cost_per"] * 100
+        cost_basis = pos["cost_basis"]
         value = pos["contracts"] * mid * 100 if mid else None
         pnl = value - cost_basis if value else None
         pnl_pct = pnl / cost_basis if pnl is not None else None
-        dte = days_until(pos["expiry"])
+        dte = (_EXPIRY_DATES[pos["expiry"]] - today).days
         intrinsic = max(0, stock_price - pos["strike_num"]) if stock_price else None
         time_val = max(0, mid - intrinsic) if mid and intrinsic is not None else None
 
         results.append({
             **pos, "bid": bid, "ask": ask, "last": last, "mid": mid,
-            "vol": vol, "oi": oi, "cost_basis": cost_basis, "value": value,
+            "vol": vol, "oi": oi, "value": value,
             "pnl": pnl, "pnl_pct": pnl_pct, "dte": dte,
-            "intrinsic": intrinsic, "time_val": time_val,
+            "intrinsic": intrinsic, "time_val": time_val, "stale": stale,
         })
 
     total_value = sum(r["value"] for r in results if r["value"])
@@ -130,21 +258,125 @@ def gather_data():
         "timestamp": datetime.now().strftime("%b %d, %Y %I:%M:%S %p ET"),
     }
 
-    _cache["data"] = d
-    _cache["time"] = now
+    # Render once per refresh; every hit in between just sends these bytes
+    html = build_html(d)
+    etag = hashlib.blake2b(html, digest_size=8).hexdigest()
+    html_gz = gzip.compress(html, compresslevel=9)
+    html_br = brotli.compress(html, quality=5) if brotli else None
+    with _cache_lock:
+        _cache.update(html=html, html_gz=html_gz, html_br=html_br, etag=etag, data=d, time=now)
+    return d
+
+
+def gather_data():
+    # Always the last good snapshot; only a cold start fetches inline
+    d = _cache["data"]
+    if d is None:
+        # Wait on any refresh already running rather than starting another
+        with _refresh_lock:
+            d = _cache["data"]
+            if d is None:
+                d = refresh_data()
     return d
 
 
+def _refresh_loop():
+    while True:
+        try:
+            with _refresh_lock:
+                refresh_data()
+        except Exception:
+            app.logger.exception("Background refresh failed")
+        time.sleep(CACHE_TTL)
+
+
+@lru_cache(maxsize=256)
 def fmt(n):
     return f"${n:,.0f}"
 
+@lru_cache(maxsize=256)
 def fmt2(n):
     return f"${n:,.2f}"
 
+@lru_cache(maxsize=256)
 def pct(n):
     return f"{'+'if n >= 0 else ''}{n*100:.1f}%"
 
 
+# Everything outside the header and cards is fixed, so encode it once at import
+HTML_HEAD_BYTES = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width,initial-scale=1,user-scalable=no">
+<meta name="apple-mobile-web-app-capable" content="yes">
+<meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
+<meta name="theme-color" content="#0a0e17">
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700&display=swap" rel="stylesheet">
+<style>
+*{margin:0;padding:0;box-sizing:border-box}
+body{background:#0a0e17;color:#e2e8f0;font-family:'JetBrains Mono','SF Mono','Courier New',monospace;padding:20px;padding-top:max(20px,env(safe-area-inset-top));-webkit-font-smoothing:antialiased;min-height:100dvh}
+.header{border-bottom:1px solid #1e293b;padding-bottom:16px;margin-bottom:20px;display:flex;justify-content:space-between;align-items:center}
+.header-left{flex:1}
+.header-video{width:130px;height:130px;border-radius:12px;object-fit:cover;border:2px solid #1e293b;margin-left:14px;flex-shrink:0}
+.eyebrow{font-size:9px;letter-spacing:3px;color:#64748b;text-transform:uppercase;margin-bottom:4px}
+.title{font-size:22px;font-weight:700;color:#f8fafc}
+.title span{color:#64748b;font-weight:400;font-size:13px}
+.stock-price{font-size:32px;font-weight:700;color:#f8fafc;margin-top:8px}
+.ts{font-size:9px;color:#475569;margin-top:4px}
+.grid2{display:grid;grid-template-columns:1fr 1fr;gap:10px;margin-bottom:20px}
+.scard{background:#111827;border:1px solid #1e293b;border-radius:10px;padding:14px}
+.scard .sl{font-size:9px;color:#64748b;text-transform:uppercase;letter-spacing:2px;margin-bottom:4px}
+.scard .sv{font-size:20px;font-weight:700;color:#f8fafc}
+.scard .sub{font-size:12px;margin-top:2px}
+.card{background:#111827;border:1px solid #1e293b;border-radius:10px;padding:14px;margin-bottom:10px}
+.card-head{display:flex;justify-content:space-between;align-items:center;margin-bottom:10px}
+.card-title{font-size:13px;font-weight:700;color:#e2e8f0}
+.dte{font-size:11px;font-weight:600;padding:2px 8px;border-radius:4px}
+.row3{display:grid;grid-template-columns:repeat(3,1fr);gap:8px}
+.stat .sl{font-size:8px;color:#64748b;text-transform:uppercase;letter-spacing:1.5px}
+.stat .sv{font-size:13px;font-weight:600;color:#94a3b8;margin-top:2px}
+.stat .sv.bright{color:#f8fafc}
+.pnl-row{display:flex;justify-content:space-between;align-items:center;margin-top:10px;padding-top:10px;border-top:1px solid #1e293b}
+.footer{font-size:10px;color:#475569;text-align:center;margin-top:16px;line-height:1.5}
+.refresh{display:block;width:100%;background:#1e293b;border:1px solid #334155;color:#94a3b8;padding:14px;border-radius:8px;font-size:13px;font-family:inherit;cursor:pointer;margin-top:14px;text-align:center;text-decoration:none}
+.refresh:active{background:#334155}
+</style>
+""".encode("utf-8")
+
+HTML_TAIL_BYTES = f"""
+
+<a class="refresh" href="/" onclick="this.textContent='Refreshing...'">⟳ Refresh Quotes</a>
+
+<div class="footer">
+  459 contracts · ~$45,900 per $1 move · Data cached {CACHE_TTL}s<br>
+  Cost basis: {fmt(TOTAL_COST_BASIS)} · DTE: <span style="color:#fbbf24">yellow &lt;120d</span> · <span style="color:#fca5a5">red &lt;60d</span>
+</div>
+
+<button id="sound-btn" onclick="toggleSound()" style="position:fixed;bottom:20px;right:20px;z-index:10;background:rgba(30,41,59,0.9);border:1px solid #334155;color:#94a3b8;width:48px;height:48px;border-radius:50%;font-size:20px;cursor:pointer;backdrop-filter:blur(8px);-webkit-backdrop-filter:blur(8px)">🔇</button>
+
+<script>
+var v=document.getElementById('vid');
+var b=document.getElementById('sound-btn');
+function unmuteOnce(){{
+  v.muted=false;
+  b.textContent='🔊';
+  document.removeEventListener('click',unmuteOnce);
+  document.removeEventListener('touchstart',unmuteOnce);
+}}
+document.addEventListener('click',unmuteOnce);
+document.addEventListener('touchstart',unmuteOnce);
+function toggleSound(){{
+  v.muted=!v.muted;
+  b.textContent=v.muted?'🔇':'🔊';
+}}
+</script>
+</body>
+</html>""".encode("utf-8")
+
+
 def build_html(d):
     sp = d["stock_price"]
     tp = d["total_pnl"]
@@ -155,17 +387,17 @@ def build_html(d):
     pnl_border = "#14532d" if tp >= 0 else "#7f1d1d"
     pnl_sign = "+" if tp >= 0 else ""
 
-    cards = ""
+    card_parts = []
     for p in d["positions"]:
         pc = "#22c55e" if (p["pnl"] or 0) >= 0 else "#ef4444"
         ps = "+" if (p["pnl"] or 0) >= 0 else ""
         dte_bg = "#7f1d1d33" if p["dte"] < 60 else "#78350f33" if p["dte"] < 120 else "#1e293b"
         dte_color = "#fca5a5" if p["dte"] < 60 else "#fbbf24" if p["dte"] < 120 else "#94a3b8"
 
-        cards += f"""
+        card_parts.append(f"""
     <div class="card">
       <div class="card-head">
-        <div class="card-title">{p['label']}</div>
+        <div class="card-title">{p['label']}{' <span style="color:#64748b;font-weight:400">· stale</span>' if p['stale'] else ''}</div>
         <div class="dte" style="background:{dte_bg};color:{dte_color}">{p['dte']}d</div>
       </div>
       <div class="row3">
@@ -182,50 +414,13 @@ def build_html(d):
         <div><span class="sl">P&L</span><span style="color:{pc};font-weight:700;font-size:15px;margin-left:8px">{ps}{fmt(p['pnl']) if p['pnl'] is not None else '—'}</span></div>
         <div style="color:{pc};font-weight:700;font-size:15px">{pct(p['pnl_pct']) if p['pnl_pct'] is not None else '—'}</div>
       </div>
-    </div>"""
+    </div>""")
+    cards = "".join(card_parts)
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width,initial-scale=1,user-scalable=no">
-<meta name="apple-mobile-web-app-capable" content="yes">
-<meta name="apple-mobile-web-app-status-bar-style" content="black-translucent">
-<meta property="og:title" content="CIFR Portfolio | {pnl_sign}{fmt(tp)} ({pct(tpp)})">
+    header = f"""<meta property="og:title" content="CIFR Portfolio | {pnl_sign}{fmt(tp)} ({pct(tpp)})">
 <meta property="og:description" content="CIFR ${sp:.2f} | Portfolio {fmt(tv)} | P&L {pnl_sign}{fmt(tp)}">
-<meta property="og:image" content="/profile.jpg">
-<meta name="theme-color" content="#0a0e17">
+<meta property="og:image" content="{PROFILE_URL}">
 <title>CIFR {pnl_sign}{fmt(tp)}</title>
-<link href="https://fonts.googleapis.com/css2?family=JetBrains+Mono:wght@400;600;700&display=swap" rel="stylesheet">
-<style>
-*{{margin:0;padding:0;box-sizing:border-box}}
-body{{background:#0a0e17;color:#e2e8f0;font-family:'JetBrains Mono','SF Mono','Courier New',monospace;padding:20px;padding-top:max(20px,env(safe-area-inset-top));-webkit-font-smoothing:antialiased;min-height:100dvh}}
-.header{{border-bottom:1px solid #1e293b;padding-bottom:16px;margin-bottom:20px;display:flex;justify-content:space-between;align-items:center}}
-.header-left{{flex:1}}
-.header-video{{width:130px;height:130px;border-radius:12px;object-fit:cover;border:2px solid #1e293b;margin-left:14px;flex-shrink:0}}
-.eyebrow{{font-size:9px;letter-spacing:3px;color:#64748b;text-transform:uppercase;margin-bottom:4px}}
-.title{{font-size:22px;font-weight:700;color:#f8fafc}}
-.title span{{color:#64748b;font-weight:400;font-size:13px}}
-.stock-price{{font-size:32px;font-weight:700;color:#f8fafc;margin-top:8px}}
-.ts{{font-size:9px;color:#475569;margin-top:4px}}
-.grid2{{display:grid;grid-template-columns:1fr 1fr;gap:10px;margin-bottom:20px}}
-.scard{{background:#111827;border:1px solid #1e293b;border-radius:10px;padding:14px}}
-.scard .sl{{font-size:9px;color:#64748b;text-transform:uppercase;letter-spacing:2px;margin-bottom:4px}}
-.scard .sv{{font-size:20px;font-weight:700;color:#f8fafc}}
-.scard .sub{{font-size:12px;margin-top:2px}}
-.card{{background:#111827;border:1px solid #1e293b;border-radius:10px;padding:14px;margin-bottom:10px}}
-.card-head{{display:flex;justify-content:space-between;align-items:center;margin-bottom:10px}}
-.card-title{{font-size:13px;font-weight:700;color:#e2e8f0}}
-.dte{{font-size:11px;font-weight:600;padding:2px 8px;border-radius:4px}}
-.row3{{display:grid;grid-template-columns:repeat(3,1fr);gap:8px}}
-.stat .sl{{font-size:8px;color:#64748b;text-transform:uppercase;letter-spacing:1.5px}}
-.stat .sv{{font-size:13px;font-weight:600;color:#94a3b8;margin-top:2px}}
-.stat .sv.bright{{color:#f8fafc}}
-.pnl-row{{display:flex;justify-content:space-between;align-items:center;margin-top:10px;padding-top:10px;border-top:1px solid #1e293b}}
-.footer{{font-size:10px;color:#475569;text-align:center;margin-top:16px;line-height:1.5}}
-.refresh{{display:block;width:100%;background:#1e293b;border:1px solid #334155;color:#94a3b8;padding:14px;border-radius:8px;font-size:13px;font-family:inherit;cursor:pointer;margin-top:14px;text-align:center;text-decoration:none}}
-.refresh:active{{background:#334155}}
-</style>
 </head>
 <body>
 
@@ -238,7 +433,7 @@ body{{background:#0a0e17;color:#e2e8f0;font-family:'JetBrains Mono','SF Mono','C
     <div class="ts">{d['timestamp']} · Nasdaq Delayed</div>
   </div>
   <video class="header-video" autoplay loop playsinline muted id="vid">
-    <source src="/celebration.mp4" type="video/mp4">
+    <source src="{VIDEO_URL}" type="video/mp4">
   </video>
 </div>
 
@@ -254,53 +449,53 @@ body{{background:#0a0e17;color:#e2e8f0;font-family:'JetBrains Mono','SF Mono','C
   </div>
 </div>
 
-{cards}
+"""
+    return b"".join([
+        HTML_HEAD_BYTES, header.encode("utf-8"), cards.encode("utf-8"), HTML_TAIL_BYTES,
+    ])
 
-<a class="refresh" href="/" onclick="this.textContent='Refreshing...'">⟳ Refresh Quotes</a>
 
-<div class="footer">
-  459 contracts · ~$45,900 per $1 move · Data cached {CACHE_TTL}s<br>
-  Cost basis: {fmt(TOTAL_COST_BASIS)} · DTE: <span style="color:#fbbf24">yellow &lt;120d</span> · <span style="color:#fca5a5">red &lt;60d</span>
-</div>
-
-<button id="sound-btn" onclick="toggleSound()" style="position:fixed;bottom:20px;right:20px;z-index:10;background:rgba(30,41,59,0.9);border:1px solid #334155;color:#94a3b8;width:48px;height:48px;border-radius:50%;font-size:20px;cursor:pointer;backdrop-filter:blur(8px);-webkit-backdrop-filter:blur(8px)">🔇</button>
-
-<script>
-var v=document.getElementById('vid');
-var b=document.getElementById('sound-btn');
-function unmuteOnce(){{
-  v.muted=false;
-  b.textContent='🔊';
-  document.removeEventListener('click',unmuteOnce);
-  document.removeEventListener('touchstart',unmuteOnce);
-}}
-document.addEventListener('click',unmuteOnce);
-document.addEventListener('touchstart',unmuteOnce);
-function toggleSound(){{
-  v.muted=!v.muted;
-  b.textContent=v.muted?'🔇':'🔊';
-}}
-</script>
-</body>
-</html>"""
+def send_asset(filename):
+    # Conditional (ETag / Range) responses with a long immutable cache lifetime
+    asset = ASSETS[filename]
+    resp = Response(asset["data"], mimetype=asset["mimetype"])
+    resp.set_etag(asset["etag"])
+    resp.cache_control.public = True
+    resp.cache_control.max_age = ASSET_MAX_AGE
+    resp.cache_control.immutable = True
+    return resp.make_conditional(request, accept_ranges=True, complete_length=len(asset["data"]))
 
 
 @app.route("/profile.jpg")
 def profile_image():
-    return send_from_directory(APP_DIR, "profile.jpg", mimetype="image/jpeg")
+    return send_asset("profile.jpg")
 
 
 @app.route("/celebration.mp4")
 def celebration_video():
-    return send_from_directory(APP_DIR, "celebration.mp4", mimetype="video/mp4")
+    return send_asset("celebration.mp4")
 
 
 @app.route("/")
 def index():
     try:
-        d = gather_data()
-        html = build_html(d)
-        return Response(html, mimetype="text/html")
+        gather_data()
+        with _cache_lock:
+            body, gz, br, etag = _cache["html"], _cache["html_gz"], _cache["html_br"], _cache["etag"]
+
+        # Serve whichever pre-compressed variant the client accepts
+        encoding = request.accept_encodings.best_match(["br", "gzip"] if br else ["gzip"])
+        headers = {"Cache-Control": f"public, max-age={CACHE_TTL}", "Vary": "Accept-Encoding"}
+        if encoding == "br":
+            body, etag = br, f"{etag}-br"
+            headers["Content-Encoding"] = "br"
+        elif encoding == "gzip":
+            body, etag = gz, f"{etag}-gz"
+            headers["Content-Encoding"] = "gzip"
+
+        resp = Response(body, mimetype="text/html", headers=headers)
+        resp.set_etag(etag)
+        return resp.make_conditional(request)
     except Exception as e:
         return Response(
             f"""<html><body style="background:#0a0e17;color:#fca5a5;font-family:monospace;padding:40px">
@@ -313,12 +508,19 @@ def index():
 @app.route("/api")
 def api():
     try:
-        d = gather_data()
-        return json.dumps(d, default=str)
+        gather_data()
+        with _cache_lock:
+            d, fetched_at = _cache["data"], _cache["time"]
+        payload = {**d, "stale_seconds": round(time.time() - fetched_at)}
+        return Response(json_dumps(payload), mimetype="application/json")
     except Exception as e:
-        return json.dumps({"error": str(e)}), 500
+        return Response(json_dumps({"error": str(e)}), status=500, mimetype="application/json")
+
+
+threading.Thread(target=_refresh_loop, daemon=True).start()
 
 
 if __name__ == "__main__":
+    # Local dev only; deploys run gunicorn via Procfile / render.yaml
     port = int(os.environ.get("PORT", 5000))
     app.run(host="0.0.0.0", port=port, debug=False)